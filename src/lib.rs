@@ -350,6 +350,27 @@ impl QuorumResult {
             heal: false,
         }
     }
+
+    /// unpack returns the fields needed to configure the next step in a single
+    /// call rather than one attribute access per field.
+    ///
+    /// Returns:
+    ///   tuple: (quorum_id, replica_rank, replica_world_size,
+    ///   recover_src_manager_address, store_address, max_step,
+    ///   max_replica_rank, max_world_size, heal)
+    fn unpack(&self) -> (i64, i64, i64, String, String, i64, Option<i64>, i64, bool) {
+        (
+            self.quorum_id,
+            self.replica_rank,
+            self.replica_world_size,
+            self.recover_src_manager_address.clone(),
+            self.store_address.clone(),
+            self.max_step,
+            self.max_replica_rank,
+            self.max_world_size,
+            self.heal,
+        )
+    }
 }
 
 fn reset_python_signals(py: Python<'_>) -> PyResult<()> {
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from datetime import timedelta
-from typing import Hashable, List, Optional
+from typing import Hashable, List, Optional, Tuple
 
 class ManagerClient:
     def __init__(self, addr: str, connect_timeout: timedelta) -> None: ...
@@ -37,6 +37,10 @@ class QuorumResult:
     heal: bool
     commit_failures: int
 
+    def unpack(
+        self,
+    ) -> Tuple[int, int, int, str, str, int, Optional[int], int, bool]: ...
+
 class ManagerServer:
     def __init__(
         self,
@@ -4,6 +4,7 @@
 # This source code is licensed under the BSD-style license found in the
 # LICENSE file in the root directory of this source tree.
 
+import io
 import logging
 import socket
 import threading
@@ -13,7 +14,7 @@ from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager, nullcontext
 from datetime import timedelta
 from http.server import BaseHTTPRequestHandler
-from typing import Generator, List, Optional, TypeVar, cast
+from typing import Dict, Generator, List, Optional, TypeVar, cast
 
 import torch
 from torch.utils._pytree import TreeSpec, tree_flatten, tree_unflatten
@@ -64,6 +65,13 @@ class HTTPTransport(CheckpointTransport[T]):
         self._spec: Optional[TreeSpec] = None
         self._chunks: Optional[List[List[object]]] = None
 
+        # When sending to multiple ranks we serialize each part of the
+        # checkpoint once and serve the same bytes to every request.
+        self._cache_serialized = False
+        self._serialized: Dict[str, memoryview] = {}
+        self._serialized_locks: Dict[str, threading.Lock] = {}
+        self._serialized_lock = threading.Lock()
+
         # We don't allow checkpoints until the first send_checkpoint to avoid
         # serving the default step=-1 invalid checkpoint.
         self.disallow_checkpoint()
@@ -101,29 +109,20 @@ class HTTPTransport(CheckpointTransport[T]):
 
                         key = parts[3]
                         if key == "full":
-                            self.send_response(200)
-                            self.send_header("Content-type", "application/octet-stream")
-                            self.end_headers()
-
-                            state_dict = ckpt_server._state_dict
-
-                            _streaming_save(state_dict, self.wfile)
-                            return
-
-                        if key == "metadata":
-                            self.send_response(200)
-                            self.send_header("Content-type", "application/octet-stream")
-                            self.end_headers()
-
-                            _streaming_save(ckpt_server._spec, self.wfile)
+                            obj = ckpt_server._state_dict
+                        elif key == "metadata":
+                            obj = ckpt_server._spec
                         else:
-                            chunk = ckpt_server._chunks[int(key)]
+                            obj = ckpt_server._chunks[int(key)]
 
-                            self.send_response(200)
-                            self.send_header("Content-type", "application/octet-stream")
-                            self.end_headers()
+                        self.send_response(200)
+                        self.send_header("Content-type", "application/octet-stream")
+                        self.end_headers()
 
-                            _streaming_save(chunk, self.wfile)
+                        if ckpt_server._cache_serialized:
+                            self.wfile.write(ckpt_server._serialize(key, obj))
+                        else:
+                            _streaming_save(obj, self.wfile)
                 except Exception as e:
                     logger.exception(
                         f"Exception in checkpoint server when handling {self.path=}: {e}",
@@ -178,6 +177,28 @@ class HTTPTransport(CheckpointTransport[T]):
         except Exception as e:
             logger.exception("got exception in checkpoint server")
 
+    def _serialize(self, key: str, obj: object) -> memoryview:
+        """
+        Returns the serialized bytes for a part of the current checkpoint,
+        serializing it on first use. Different parts can be serialized
+        concurrently.
+
+        Args:
+            key: the checkpoint part (full, metadata or the chunk index)
+            obj: the object to serialize for the part
+        """
+        with self._serialized_lock:
+            lock = self._serialized_locks.setdefault(key, threading.Lock())
+
+        with lock:
+            buf = self._serialized.get(key)
+            if buf is None:
+                f = io.BytesIO()
+                with _time(f"serializing checkpoint part {key}"):
+                    _streaming_save(obj, f)
+                buf = self._serialized[key] = f.getbuffer()
+            return buf
+
     def disallow_checkpoint(self) -> None:
         """
         Disallows serving the checkpoint.
@@ -188,6 +209,11 @@ class HTTPTransport(CheckpointTransport[T]):
             self._disallowed = True
             self._checkpoint_lock.w_acquire()
 
+            # no handlers can be reading the cache while we hold the write lock
+            # so release the serialized copy of the checkpoint
+            self._serialized = {}
+            self._serialized_locks = {}
+
     def allow_checkpoint(self, step: int) -> None:
         """
         Allows serving the checkpoint with the specified step number.
@@ -238,6 +264,12 @@ class HTTPTransport(CheckpointTransport[T]):
         self._spec = spec
         self._chunks = _split_chunks(values, self._num_chunks)
 
+        # Streaming directly to the socket avoids holding a serialized copy
+        # in memory so only cache when it'll be reused.
+        self._cache_serialized = len(dst_ranks) > 1
+        self._serialized = {}
+        self._serialized_locks = {}
+
         self.allow_checkpoint(step)
 
     def recv_checkpoint(
@@ -8,11 +8,12 @@ import urllib.error
 from datetime import timedelta
 from typing import Dict
 from unittest import TestCase, skipUnless
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import torch
 from parameterized import parameterized
 
+from torchft.checkpointing import http_transport
 from torchft.checkpointing.http_transport import HTTPTransport
 from torchft.checkpointing.http_transport_bench import main as bench_main
 from torchft.checkpointing.transport import CheckpointTransport
@@ -81,6 +82,46 @@ class TestHTTPTransport(TestCase):
 
         server.shutdown()
 
+    def test_checkpoint_server_serializes_once(self) -> None:
+        expected: Dict[str, object] = {
+            "state": "dict",
+            "tensor": torch.rand(5, 2),
+        }
+        server = HTTPTransport(
+            timeout=timedelta(seconds=10),
+            num_chunks=0,
+        )
+
+        with patch.object(
+            http_transport,
+            "_streaming_save",
+            wraps=http_transport._streaming_save,
+        ) as save_mock:
+            server.send_checkpoint(
+                dst_ranks=[1, 2],
+                step=1234,
+                state_dict=expected,
+                timeout=timedelta(seconds=10),
+            )
+
+            metadata = server.metadata()
+            for _ in range(2):
+                out = server.recv_checkpoint(
+                    src_rank=0,
+                    metadata=metadata,
+                    step=1234,
+                    timeout=timedelta(seconds=10),
+                )
+                assertStateDictEqual(self, out, expected)
+
+            self.assertEqual(save_mock.call_count, 1)
+
+        server.disallow_checkpoint()
+        self.assertEqual(server._serialized, {})
+        self.assertEqual(server._serialized_locks, {})
+
+        server.shutdown()
+
     def test_checkpoint_server_locking(self) -> None:
         server = HTTPTransport(
             timeout=timedelta(seconds=10),
@@ -253,14 +253,15 @@ class PGTransport(CheckpointTransport[T]):
         def recv(path: KeyPath, v: _TensorMeta) -> torch.Tensor:
             nonlocal i
 
-            inplace = dst_tensors.get(path)
-            if (
-                isinstance(inplace, torch.Tensor)
-                and inplace.device.type == self._device.type
-            ):
-                if isinstance(inplace, DTensor):
-                    inplace = inplace._local_tensor
-                t = _cast_tensor(inplace, torch.uint8)
+            target = dst_tensors.get(path)
+            inplace = (
+                isinstance(target, torch.Tensor)
+                and target.device.type == self._device.type
+            )
+            if inplace:
+                if isinstance(target, DTensor):
+                    target = target._local_tensor
+                t = _cast_tensor(target, torch.uint8)
                 assert (
                     t.nbytes == v.nbytes
                 ), "inplace tensor storage must be the same size"
@@ -270,12 +271,17 @@ class PGTransport(CheckpointTransport[T]):
             work = self._pg.recv([t], src_rank, tag=3 + i)
             i += 1
 
-            if inplace is None:
-                # if not inplace we need to copy it to CPU to avoid OOMing
-                work.wait(timeout)
-                t = t.cpu()
-            else:
+            if inplace:
                 works.append(work)
+            else:
+                # If not inplace we need to copy it off the transport device to
+                # avoid OOMing. Targets on another device (i.e. CPU optimizer
+                # state) keep their device.
+                work.wait(timeout)
+                if isinstance(target, torch.Tensor):
+                    t = t.to(target.device)
+                else:
+                    t = t.cpu()
 
             return torch.as_strided(
                 t.view(v.dtype),
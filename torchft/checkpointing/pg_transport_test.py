@@ -1,4 +1,5 @@
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from unittest import TestCase, skipIf, skipUnless
 
@@ -90,3 +91,58 @@ class PGTransportTest(TestCase):
             )
 
         run_multi_recovery_test(self, init, device=device)
+
+    # pyre-fixme[56]: Pyre was not able to infer the type of argument
+    @skipUnless(torch.cuda.device_count() >= 2, "need two CUDA devices")
+    def test_pg_transport_baby_nccl_inplace_cpu_target(self) -> None:
+        store: TCPStore = TCPStore(
+            host_name="localhost", port=0, is_master=True, wait_for_workers=False
+        )
+        device: torch.device = torch.device("cuda")
+        timeout: timedelta = timedelta(seconds=10)
+
+        def run(rank: int) -> dict[str, torch.Tensor]:
+            torch.cuda.set_device(rank)
+
+            # mirrors an optimizer state_dict with CPU resident step counters
+            target = {
+                "param": torch.zeros(4, device=device),
+                "step": torch.zeros(1),
+            }
+
+            pg = ProcessGroupBabyNCCL(timeout=timeout)
+            pg.configure(
+                store_addr=f"localhost:{store.port}/prefix",
+                rank=rank,
+                world_size=2,
+            )
+            transport = PGTransport[dict[str, torch.Tensor]](
+                pg, timeout=timeout, device=device, state_dict=lambda: target
+            )
+
+            if rank == 0:
+                transport.send_checkpoint(
+                    dst_ranks=[1],
+                    step=1,
+                    state_dict={
+                        "param": torch.arange(4, dtype=torch.float32, device=device),
+                        "step": torch.tensor([7.0]),
+                    },
+                    timeout=timeout,
+                )
+                return target
+
+            got = transport.recv_checkpoint(
+                src_rank=0, metadata="<n/a>", step=1, timeout=timeout
+            )
+            torch.testing.assert_close(target["param"].cpu(), torch.arange(4.0))
+            return got
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(run, rank) for rank in range(2)]
+            got = futures[1].result()
+            futures[0].result()
+
+        self.assertEqual(got["param"].device.type, "cuda")
+        self.assertEqual(got["step"].device.type, "cpu")
+        torch.testing.assert_close(got["step"], torch.tensor([7.0]))
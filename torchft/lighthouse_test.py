@@ -1,5 +1,6 @@
 import time
 from datetime import timedelta
+from typing import Callable, Optional
 from unittest import TestCase
 
 import torch.distributed as dist
@@ -8,7 +9,63 @@ from torchft import Manager, ProcessGroupGloo
 from torchft._torchft import LighthouseClient, LighthouseServer, Quorum, QuorumMember
 
 
+def _wait_until(pred: Callable[[], bool], timeout: float = 2.0) -> bool:
+    """
+    Polls pred with exponential backoff until it returns True or the timeout
+    expires. Exceptions raised by pred are retried but if the timeout expires
+    the last exception is re-raised so failures aren't hidden.
+    """
+    deadline = time.perf_counter() + timeout
+    delay = 0.005
+    last_exc: Optional[Exception] = None
+    while time.perf_counter() < deadline:
+        try:
+            if pred():
+                return True
+            last_exc = None
+        except Exception as e:
+            last_exc = e
+        time.sleep(delay)
+        delay = min(delay * 2, 0.05)
+    if last_exc is not None:
+        raise last_exc
+    return False
+
+
 class TestLighthouse(TestCase):
+    lighthouse: LighthouseServer  # pyre-fixme[13]: never initialized
+    client: LighthouseClient  # pyre-fixme[13]: never initialized
+    store: dist.TCPStore  # pyre-fixme[13]: never initialized
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+
+        # Shared lighthouse for the tests that only exercise the failure stream
+        # and don't depend on quorum membership or timeouts.
+        cls.lighthouse = LighthouseServer(
+            bind="[::]:0",
+            min_replicas=1,
+            join_timeout_ms=100,
+        )
+        cls.client = LighthouseClient(
+            addr=cls.lighthouse.address(),
+            connect_timeout=timedelta(seconds=5),
+        )
+        # The tests only need a store to advertise an address, so share one
+        # rather than binding a new listener per test.
+        cls.store = dist.TCPStore(
+            host_name="localhost",
+            port=0,
+            is_master=True,
+            wait_for_workers=False,
+        )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.lighthouse.shutdown()
+        super().tearDownClass()
+
     def test_join_timeout_behavior(self) -> None:
         """Test that join_timeout_ms affects joining behavior"""
         # To test, we create a lighthouse with 100ms and 400ms join timeouts
@@ -21,12 +78,7 @@ class TestLighthouse(TestCase):
 
         # Create a manager that tries to join
         try:
-            store = dist.TCPStore(
-                host_name="localhost",
-                port=0,
-                is_master=True,
-                wait_for_workers=False,
-            )
+            store = self.store
             pg = ProcessGroupGloo()
             manager = Manager(
                 pg=pg,
@@ -83,12 +135,7 @@ class TestLighthouse(TestCase):
                 addr=lighthouse.address(),
                 connect_timeout=timedelta(seconds=1),
             )
-            store = dist.TCPStore(
-                host_name="localhost",
-                port=0,
-                is_master=True,
-                wait_for_workers=False,
-            )
+            store = self.store
             result = client.quorum(
                 replica_id="lighthouse_test",
                 address="localhost",
@@ -134,74 +181,56 @@ class TestLighthouse(TestCase):
                 connect_timeout=timedelta(seconds=1),
             )
 
+            start = time.monotonic()
             client.heartbeat("rep0")
 
-            # (Should still be alive, as sleep time is less than timeout)
-            time.sleep(0.15)
+            # Join a quorum so rep0 is a member the probe below has to wait on.
+            # This is also an implicit heartbeat.
             q = client.quorum(
                 replica_id="rep0",
                 timeout=timedelta(milliseconds=500),
             )
             assert any(m.replica_id == "rep0" for m in q.participants)
 
-            # (Wait long enough for timeout to trigger)
-            time.sleep(0.25)
+            # (Poll until the timeout triggers, this must happen shortly after
+            # the 200ms heartbeat timeout)
             # "Probe" with different replica so we don't revive rep0
-            probe = client.quorum(
-                replica_id="probe",
-                timeout=timedelta(milliseconds=500),
-            )
-            assert all(m.replica_id != "rep0" for m in probe.participants)
+            assert _wait_until(
+                lambda: all(
+                    m.replica_id != "rep0"
+                    for m in client.quorum(
+                        replica_id="probe",
+                        timeout=timedelta(milliseconds=100),
+                    ).participants
+                ),
+                timeout=0.5,
+            ), "rep0 heartbeat did not expire in time"
+
+            # (Should have stayed alive until the heartbeat timeout)
+            elapsed = time.monotonic() - start
+            assert elapsed >= 0.2, f"rep0 expired early after {elapsed:.3f}s"
 
         finally:
             lighthouse.shutdown()
 
     def test_subscribe_failures(self) -> None:
         """Test that subscribe_failures can be called without raising an exception."""
-        lighthouse = LighthouseServer(
-            bind="[::]:0",
-            min_replicas=1,
-        )
-        try:
-            client = LighthouseClient(
-                addr=lighthouse.address(),
-                connect_timeout=timedelta(seconds=1),
-            )
-            stream = client.subscribe_failures(timeout=timedelta(milliseconds=100))
-        finally:
-            lighthouse.shutdown()
+        stream = self.client.subscribe_failures(timeout=timedelta(milliseconds=100))
 
     def test_subscribe_failures_notification(self) -> None:
         """Test that failure notifications are delivered to subscribers."""
-        lighthouse = LighthouseServer(
-            bind="[::]:0",
-            min_replicas=1,
-        )
-        try:
-            client = LighthouseClient(
-                addr=lighthouse.address(),
-                connect_timeout=timedelta(seconds=1),
-            )
-            stream = client.subscribe_failures(timeout=timedelta(seconds=1))
-            lighthouse.inject_failure("nodeX")
-            note = next(stream)
-            assert note.replica_id == "nodeX"
-        finally:
-            lighthouse.shutdown()
+        stream = self.client.subscribe_failures(timeout=timedelta(seconds=1))
+        self.lighthouse.inject_failure("nodeX")
+        note = next(stream)
+        assert note.replica_id == "nodeX"
 
     def test_inject_failure(self) -> None:
         """Test that inject failure delivers a failure notification to subscribers"""
-        # Start a lighthouse server
-        server = LighthouseServer(
-            bind="[::]:0",
-            min_replicas=1,
-            join_timeout_ms=100,
-        )
+        server = self.lighthouse
         print(f"Server address: {server.address()}")
 
-        # Create a client to subscribe to failures
-        client = LighthouseClient(server.address(), timedelta(seconds=5))
-        failure_stream = client.subscribe_failures(timedelta(seconds=5))
+        # Subscribe to failures
+        failure_stream = self.client.subscribe_failures(timedelta(seconds=5))
 
         # Inject a failure
         replica_id = "test_replica"
@@ -221,6 +250,3 @@ class TestLighthouse(TestCase):
             print("Test passed!")
         except Exception as e:
             print(f"Error: {e}")
-
-        # Clean up
-        server.shutdown()
@@ -56,7 +56,7 @@ def local_sgd_train_loop(
             rank=rank,
             world_size=runner.world_size,
             lighthouse_addr=runner.lighthouse_address,
-            port=19530 + runner.replica_id,
+            port=0,
             timeout=timedelta(seconds=10),
             # pyre-fixme[6]: Incompatible parameter type
             **runner.manager_args,
@@ -148,7 +148,7 @@ def diloco_train_loop(
             rank=rank,
             world_size=runner.world_size,
             lighthouse_addr=runner.lighthouse_address,
-            port=19530 + runner.replica_id,
+            port=0,
             connect_timeout=timedelta(seconds=10),
             quorum_timeout=timedelta(seconds=10),
             timeout=timedelta(seconds=10),
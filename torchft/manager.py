@@ -38,10 +38,22 @@ from contextlib import nullcontext
 from datetime import timedelta
 from enum import Enum
 from multiprocessing.connection import Connection
-from typing import TYPE_CHECKING, Callable, Dict, List, Optional, TypeVar, cast
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    ContextManager,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
 
 import torch
 from torch.distributed import ReduceOp, TCPStore
+from torch.distributed.distributed_c10d import _make_nccl_premul_sum
 
 from torchft._torchft import LighthouseClient, ManagerClient, ManagerServer
 from torchft.checkpointing import CheckpointTransport, HTTPTransport
@@ -56,6 +68,7 @@ MANAGER_PORT_ENV: str = "TORCHFT_MANAGER_PORT"
 REPLICA_ID_KEY: str = "replica_id"
 
 T = TypeVar("T")
+S = TypeVar("S")
 
 
 class WorldSizeMode(Enum):
@@ -79,8 +92,32 @@ class WorldSizeMode(Enum):
 class ExceptionWithTraceback(Exception):
     def __init__(self, e: Exception) -> None:
         self.original_exception = e
-        self.stack_trace: str = traceback.format_exc()
-        super().__init__(f"{e}\n{self.stack_trace}")
+        # Formatting the traceback is expensive and most reported errors are
+        # never displayed so we format it lazily.
+        self._stack_trace: Optional[str] = None
+        super().__init__(e)
+
+    @property
+    def stack_trace(self) -> str:
+        if self._stack_trace is None:
+            e = self.original_exception
+            self._stack_trace = "".join(
+                traceback.format_exception(type(e), e, e.__traceback__)
+            )
+        return self._stack_trace
+
+    def __str__(self) -> str:
+        return f"{self.original_exception}\n{self.stack_trace}"
+
+    def __reduce__(
+        self,
+    ) -> Tuple[Type["ExceptionWithTraceback"], Tuple[Exception], Dict[str, object]]:
+        # tracebacks can't be pickled so send the formatted version
+        return (
+            type(self),
+            (self.original_exception,),
+            {"_stack_trace": self.stack_trace},
+        )
 
 
 class Manager:
@@ -116,7 +153,7 @@ class Manager:
         lighthouse_addr: Optional[str] = None,
         replica_id: Optional[str] = None,
         port: Optional[int] = None,
-        hostname: str = socket.gethostname(),
+        hostname: Optional[str] = None,
         heartbeat_interval: timedelta = timedelta(milliseconds=100),
         checkpoint_transport: Optional[CheckpointTransport[Dict[str, T]]] = None,
         init_sync: bool = True,
@@ -156,7 +193,8 @@ class Manager:
             store_port: TCPStore port for this replica group
             lighthouse_addr: if rank==0, the address of the lighthouse server
             replica_id: if rank==0, the replica_id for this group
-            hostname: if rank==0, the hostname to advertise to the lighthouse server
+            hostname: if rank==0, the hostname to advertise to the lighthouse
+                server, defaults to socket.gethostname()
             checkpoint_transport: the checkpoint transport to use for
                 transfering checkpoints to recovering replicas, defaults to HTTPTransport
             init_sync: whether to synchronize the model weights on step 0. If
@@ -196,7 +234,14 @@ class Manager:
         self._checkpoint_transport: CheckpointTransport[Dict[str, T]] = (
             checkpoint_transport
         )
-        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="")
+        # The worker threads are long lived and reused across steps so we only
+        # need to name them once rather than on every quorum.
+        self._executor = ThreadPoolExecutor(
+            max_workers=2,
+            thread_name_prefix="torchft_quorum",
+            initializer=torch.multiprocessing._set_thread_name,
+            initargs=("torchft_quorum",),
+        )
         self._quorum_future: Optional[concurrent.futures.Future] = None
 
         self._store = TCPStore(
@@ -206,11 +251,14 @@ class Manager:
             wait_for_workers=False,
         )
         self._pg = pg
+        self._use_premul_sum: bool = _supports_premul_sum(pg)
         self._manager: Optional[ManagerServer] = None
 
         self._recovery_stream: Optional["torch.cuda.Stream"] = (
             torch.cuda.Stream() if torch.cuda.is_available() else None
         )
+        # recorded on the recovery stream once all recovery work is enqueued
+        self._recovery_event: Optional["torch.cuda.Event"] = None
 
         lighthouse_addr: Optional[str] = lighthouse_addr
         if os.environ.get("TORCHFT_LIGHTHOUSE") is not None:
@@ -244,6 +292,7 @@ class Manager:
         else:
             self._failure_listener_process = None
             self._error_pipe = None
+            self._error_remote = None
             self._failure_listener_stop_event = None
 
         # Initialize and start the error processing thread if the listener process is active
@@ -275,19 +324,28 @@ class Manager:
             self._manager = ManagerServer(
                 replica_id=replica_id,
                 lighthouse_addr=lighthouse_addr,
-                hostname=hostname,
+                hostname=hostname or socket.gethostname(),
                 bind=bind,
                 store_addr=f"{store_addr}:{store_port}",
                 world_size=group_world_size,
                 heartbeat_interval=heartbeat_interval,
                 connect_timeout=connect_timeout,
             )
-            self._store.set(MANAGER_ADDR_KEY, self._manager.address())
-            self._store.set(REPLICA_ID_KEY, replica_id)
+            self._store.multi_set(
+                [MANAGER_ADDR_KEY, REPLICA_ID_KEY],
+                [self._manager.address(), replica_id],
+            )
 
-        addr = self._store.get(MANAGER_ADDR_KEY).decode("utf-8")
+        addr, replica_id = (
+            value.decode("utf-8")
+            for value in self._store.multi_get([MANAGER_ADDR_KEY, REPLICA_ID_KEY])
+        )
         self._client = ManagerClient(addr, connect_timeout=connect_timeout)
-        replica_id = self._store.get(REPLICA_ID_KEY).decode("utf-8")
+        # client for fetching checkpoint metadata from the most recent recovery
+        # source so repeated heals from the same peer reuse the connection. Only
+        # one is kept as each client owns its own runtime and threads.
+        self._primary_client_address: Optional[str] = None
+        self._primary_client_cache: Optional[ManagerClient] = None
         self._logger = _ManagerLogger(
             manager=self, replica_id=replica_id or "", group_rank=group_rank
         )
@@ -326,13 +384,13 @@ class Manager:
         try:
             while not self._error_processor_stop_event.is_set():
                 try:
-                    item = self._error_pipe.recv(0.1)
-                except TimeoutError:
-                    continue
-                except OSError:
+                    # Block until an error arrives, shutdown wakes us up by
+                    # sending an empty message.
+                    msg = self._error_pipe.recv_bytes(None)
+                except (OSError, EOFError):
                     break
-                except Exception as e:
-                    self._error_handler(e)
+                if msg:
+                    self._error_handler(Exception(msg.decode("utf-8")))
         finally:
             pass
 
@@ -350,6 +408,12 @@ class Manager:
         ):
             self._logger.info("Setting error processor thread stop event")
             self._error_processor_stop_event.set()
+            if self._error_remote is not None:
+                try:
+                    # wake up the blocking recv in the error processor loop
+                    self._error_remote.send_bytes(b"")
+                except OSError as e:
+                    self._logger.warn(f"Failed to wake error processor thread: {e}")
             if wait:
                 self._logger.info("Waiting for error processor thread to complete")
                 try:
@@ -362,6 +426,12 @@ class Manager:
                         self._logger.info("Error processor thread shutdown completed.")
                 except Exception as e:
                     self._logger.warn(f"Error waiting for error processor thread: {e}")
+            # the wake up message is already buffered in the pipe so our end is
+            # no longer needed unless the thread is still stuck reading from it
+            if self._error_remote is not None and (
+                not wait or not self._error_processor_thread.is_alive()
+            ):
+                self._error_remote.close()
 
         # Stop the failure listener process if it exists
         if (
@@ -419,7 +489,8 @@ class Manager:
         Returns:
             a Future that will be completed with the allreduced tensor
         """
-        if self.errored():
+        # read the attribute directly as this is called once per bucket
+        if self._errored is not None:
             fut = torch.futures.Future()  # pyre-fixme[29]: not a function
             fut.set_result(tensor)
             return fut
@@ -429,30 +500,36 @@ class Manager:
         if not self.is_participating():
             tensor.zero_()
 
+        # The number of participants is fixed for the step so read it once
+        # rather than from the completion callback. The quorum has already
+        # completed above so there's no need to go through num_participants().
+        num_participants = self._participating_replica_world_size
+
         # TODO: increase timeout when waiting when healing
         try:
             # Run the allreduce async and save the work object so we can wait on
             # it later.
-            work = self._pg.allreduce([tensor], ReduceOp.SUM)
-            fut = work.get_future()
-
-            # schedule grad normalization as a continuation
-            # on the Future
-            def callback(
-                fut: torch.futures.Future[List[torch.Tensor]],
-            ) -> torch.Tensor:
-                nonlocal tensor
+            if self._use_premul_sum and tensor.is_floating_point():
+                # NCCL can apply the normalization as part of the reduction
+                # which avoids a second pass over the tensor.
+                op = _make_nccl_premul_sum(1.0 / num_participants)
+                normalize = False
+            else:
+                op = ReduceOp.SUM
+                normalize = True
+            work = self._pg.allreduce([tensor], op)
 
-                # check for exceptions
-                fut.value()
+            # schedule grad normalization as part of the error handling
+            # continuation on the Future
+            def on_success(_: List[torch.Tensor]) -> torch.Tensor:
+                nonlocal tensor
 
-                tensor /= self.num_participants()
+                if normalize:
+                    tensor /= num_participants
 
                 return tensor
 
-            fut = fut.then(callback)
-            fut = self.wrap_future(fut, tensor)
-            return fut
+            return self._wrap_future(work.get_future(), tensor, on_success=on_success)
 
         except Exception as e:
             self._logger.exception(
@@ -501,18 +578,35 @@ class Manager:
             default: the default value to complete the Future with if an error occurs
             timeout: the timeout for the Future, if None, the manager's timeout will be used
         """
+        return self._wrap_future(fut, default, timeout)
+
+    def _wrap_future(
+        self,
+        fut: torch.futures.Future[S],
+        default: T,
+        timeout: Optional[timedelta] = None,
+        on_success: Optional[Callable[[S], T]] = None,
+    ) -> torch.futures.Future[T]:
+        """
+        Implementation of wrap_future that optionally transforms the result of
+        a successful Future within the same continuation so callers don't need
+        to chain a second one.
+        """
 
         # add a timeout to the future
         fut = future_timeout(fut, timeout or self._timeout)
 
         # schedule error handling as a continuation on the Future
         def callback(
-            fut: torch.futures.Future[T],
+            fut: torch.futures.Future[S],
         ) -> T:
             nonlocal default
 
             try:
-                return fut.value()
+                value = fut.value()
+                if on_success is not None:
+                    return on_success(value)
+                return cast(T, value)
             except Exception as e:
                 self._logger.exception(
                     f"got exception in future -- skipping remaining: {e}"
@@ -598,13 +692,11 @@ class Manager:
         quorum_timeout: timedelta,
         curr_device: int,
     ) -> None:
-        torch.multiprocessing._set_thread_name("torchft_quorum")
-
         if curr_device >= 0 and torch.cuda.is_available():
             torch.cuda.set_device(curr_device)
 
         quorum = None
-        with torch.profiler.record_function("torchft::manager::_client::_quorum"):
+        with _record_function("torchft::manager::_client::_quorum"):
             quorum = self._client._quorum(
                 group_rank=self._group_rank,
                 step=self._step,
@@ -615,15 +707,17 @@ class Manager:
                 commit_failures=self._commit_failures,
             )
 
-        quorum_id = quorum.quorum_id
-        replica_rank = quorum.replica_rank
-        replica_world_size = quorum.replica_world_size
-        recover_src_manager_address = quorum.recover_src_manager_address
-        store_address = quorum.store_address
-        max_step = quorum.max_step
-        max_replica_rank = quorum.max_replica_rank
-        max_replica_world_size = quorum.max_world_size
-        heal = quorum.heal
+        (
+            quorum_id,
+            replica_rank,
+            replica_world_size,
+            recover_src_manager_address,
+            store_address,
+            max_step,
+            max_replica_rank,
+            max_replica_world_size,
+            heal,
+        ) = quorum.unpack()
 
         # When using async quorum we need to take the recovered workers.
         # When not using async quorum we need to take the max world size as all
@@ -654,7 +748,7 @@ class Manager:
             self._logger.info(f"reconfiguring for {quorum_id=} {store_prefixed_addr=}")
             # We use the replica rank and world as we want all replicas in the PG.
             try:
-                with torch.profiler.record_function("torchft::manager::_pg.configure"):
+                with _record_function("torchft::manager::_pg.configure"):
                     self._pg.configure(
                         store_prefixed_addr, replica_rank, replica_world_size
                     )
@@ -677,7 +771,7 @@ class Manager:
                         self._logger.info(
                             f"peers need recovery from us {quorum.recover_dst_replica_ranks}"
                         )
-                        with torch.profiler.record_function(
+                        with _record_function(
                             "torchft::manager::_checkpoint_transport::send_checkpoint"
                         ):
                             self._checkpoint_transport.send_checkpoint(
@@ -693,9 +787,8 @@ class Manager:
                         self._logger.info(
                             f"healing required, fetching checkpoint metadata from {recover_src_manager_address=} {max_step=}"
                         )
-                        primary_client = ManagerClient(
-                            recover_src_manager_address,
-                            connect_timeout=self._connect_timeout,
+                        primary_client = self._primary_client(
+                            recover_src_manager_address
                         )
                         checkpoint_metadata = primary_client._checkpoint_metadata(
                             self._group_rank, timeout=self._timeout
@@ -711,7 +804,7 @@ class Manager:
 
                         # we apply the user state dict only when safe from the main thread
                         # save it for now
-                        with torch.profiler.record_function(
+                        with _record_function(
                             "torchft::manager::_checkpoint_transport::recv_checkpoint"
                         ):
                             self._pending_state_dict = self._checkpoint_transport.recv_checkpoint(
@@ -730,7 +823,29 @@ class Manager:
                 except Exception as e:
                     self._logger.exception(f"got exception in recovery: {e}")
                     self.report_error(e)
+                    if heal:
+                        # don't reuse a potentially broken connection
+                        self._primary_client_address = None
+                        self._primary_client_cache = None
                     return
+                finally:
+                    if recovery_stream is not None:
+                        self._recovery_event = recovery_stream.record_event()
+
+    def _primary_client(self, address: str) -> ManagerClient:
+        """
+        Returns a ManagerClient for the manager at the given address, reusing
+        the previous one if the address hasn't changed. A client for a
+        different address is released.
+        """
+        client = self._primary_client_cache
+        if client is None or self._primary_client_address != address:
+            # drop the old client first so its runtime can be released
+            self._primary_client_cache = None
+            client = ManagerClient(address, connect_timeout=self._connect_timeout)
+            self._primary_client_address = address
+            self._primary_client_cache = client
+        return client
 
     def _apply_pending_state_dict(self) -> None:
         assert self._healing, "must be in healing state"
@@ -749,8 +864,15 @@ class Manager:
             assert (
                 self._load_state_dict is not None
             ), "user load_state_dict is not initialized."
-            self._load_state_dict(pending_state_dict["user"])
+
+            # Drop our references before loading so the received checkpoint is
+            # only kept alive by the user's load_state_dict. A loader that pops
+            # entries as it applies them can then free them incrementally.
             self._pending_state_dict = None
+            user_state_dict = pending_state_dict["user"]
+            del pending_state_dict
+
+            self._load_state_dict(user_state_dict)
             self._logger.info("Loaded state dict.")
 
     @torch.profiler.record_function("torchft::manager::should_commit")
@@ -787,9 +909,11 @@ class Manager:
             # never return an error.
             work.wait()
 
-        # make sure recovery is complete before committing
-        if self._recovery_stream is not None:
-            self._recovery_stream.synchronize()
+        # make sure recovery is complete before committing, this only orders
+        # the main stream after recovery rather than blocking the host
+        if self._recovery_event is not None:
+            torch.cuda.current_stream().wait_event(self._recovery_event)
+            self._recovery_event = None
 
         self._pending_work = []
 
@@ -800,7 +924,10 @@ class Manager:
         if self._healing:
             self._apply_pending_state_dict()
 
-        enough_replicas = self.num_participants() >= self._min_replica_size
+        # the participant count is fixed once the quorum completes so only
+        # look it up once
+        num_participants = self.num_participants()
+        enough_replicas = num_participants >= self._min_replica_size
         local_should_commit = enough_replicas and self._errored is None
         should_commit = self._client.should_commit(
             self._group_rank,
@@ -817,7 +944,7 @@ class Manager:
         # decide whether we're in a healthy state to increase the step count
         if should_commit:
             self._step += 1
-            self._batches_committed += self.num_participants()
+            self._batches_committed += num_participants
             self._commit_failures = 0  # Reset failure counter on success
         else:
             self._commit_failures += 1
@@ -940,6 +1067,28 @@ class Manager:
         return True
 
 
+def _record_function(name: str) -> ContextManager[object]:
+    """
+    Returns a profiler ``record_function`` scope for the given name or a no-op
+    context when the profiler isn't running to avoid the overhead of creating
+    and entering the profiler scope on every call.
+    """
+    if torch.autograd._profiler_enabled():
+        return torch.profiler.record_function(name)
+    return nullcontext()
+
+
+def _supports_premul_sum(pg: "ProcessGroup") -> bool:
+    """
+    Whether the process group supports ``ReduceOp.PREMUL_SUM`` which lets us fold
+    the gradient normalization into the allreduce. Only NCCL supports this.
+    """
+    try:
+        return pg.getBackendName() == "torchft-nccl"
+    except NotImplementedError:
+        return False
+
+
 class _ManagerLogger:
     def __init__(self, manager: Manager, replica_id: str, group_rank: int) -> None:
         self._logger: logging.Logger = logging.getLogger(__name__)
@@ -947,17 +1096,28 @@ class _ManagerLogger:
         self._group_rank = group_rank
         self._manager = manager
 
-    def prefix(self) -> str:
-        return f"[{self._replica_id}/{self._group_rank} - step {self._manager.current_step()}]"
+    def _log(self, level: int, msg: str, exc_info: bool = False) -> None:
+        # Check the level first and let logging do the formatting so disabled
+        # messages don't pay for building the prefix.
+        if self._logger.isEnabledFor(level):
+            self._logger.log(
+                level,
+                "[%s/%s - step %s] %s",
+                self._replica_id,
+                self._group_rank,
+                self._manager.current_step(),
+                msg,
+                exc_info=exc_info,
+            )
 
     def info(self, msg: str) -> None:
-        self._logger.info(f"{self.prefix()} {msg}")
+        self._log(logging.INFO, msg)
 
     def warn(self, msg: str) -> None:
-        self._logger.warn(f"{self.prefix()} {msg}")
+        self._log(logging.WARNING, msg)
 
     def exception(self, msg: str) -> None:
-        self._logger.exception(f"{self.prefix()} {msg}")
+        self._log(logging.ERROR, msg, exc_info=True)
 
 
 def _failure_listener_process_main(
@@ -987,10 +1147,10 @@ def _failure_listener_process_main(
                     if note:
                         if stop_event.is_set():
                             break
-                        error = Exception(
-                            f"Peer failure detected in listener process: replica {note.replica_id} has failed"
-                        )
-                        error_pipe.send(ExceptionWithTraceback(error))
+                        msg = f"Peer failure detected in listener process: replica {note.replica_id} has failed"
+                        # Only the message is sent, the error processor
+                        # reconstructs the exception so nothing is pickled.
+                        error_pipe.send_bytes(msg.encode("utf-8"))
                 except StopIteration:
                     # Stream has ended, break out to outer loop to reconnect
                     if not stop_event.is_set():
@@ -1007,7 +1167,6 @@ def _failure_listener_process_main(
                         break
                 if stop_event.is_set():
                     break
-                time.sleep(0.01)  # Prevent CPU thrashing
         except Exception as e_outer:
             if not stop_event.is_set():
                 logging.warning(
@@ -187,7 +187,7 @@ def ddp_train_loop(
             rank=rank,
             world_size=runner.world_size,
             lighthouse_addr=runner.lighthouse_address,
-            port=19530 + runner.replica_id,
+            port=0,
             # pyre-fixme[6]: Incompatible parameter type
             **runner.manager_args,
         )
@@ -442,7 +442,7 @@ class ManagerIntegTest(TestCase):
                 rank=0,
                 world_size=2,
                 lighthouse_addr=lighthouse.address(),
-                port=19530,
+                port=0,
                 use_async_quorum=False,
             )
             stack.callback(lambda: manager.shutdown(wait=False))
@@ -535,7 +535,7 @@ def all_reduce_callback(
             rank=rank,
             world_size=runner.world_size,
             lighthouse_addr=runner.lighthouse_address,
-            port=19530 + runner.replica_id,
+            port=0,
             timeout=timedelta(seconds=10),
             quorum_timeout=timedelta(seconds=10),
             # pyre-fixme[6]: Incompatible parameter type
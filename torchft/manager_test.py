@@ -6,7 +6,10 @@
 
 import concurrent
 import multiprocessing
+import pickle
+import threading
 import time
+import weakref
 from dataclasses import dataclass
 from datetime import timedelta
 from typing import Optional
@@ -41,6 +44,22 @@ def mock_should_commit(
     return should_commit
 
 
+def _watch_error_handler(manager: Manager) -> threading.Event:
+    """
+    Wraps the manager's error handler so tests can wait on an event rather than
+    sleeping until the error processor thread has handled an error.
+    """
+    handled = threading.Event()
+    error_handler = manager._error_handler
+
+    def wrapped(err: Exception) -> None:
+        error_handler(err)
+        handled.set()
+
+    manager._error_handler = wrapped
+    return handled
+
+
 class TestManager(TestCase):
     store: TCPStore  # pyre-fixme[13]: never initialized
     load_state_dict: MagicMock  # pyre-fixme[13]: never initialized
@@ -240,6 +259,46 @@ class TestManager(TestCase):
 
         self.assertEqual(self.load_state_dict.call_count, 1)
 
+    @patch("torchft.manager.ManagerClient", autospec=True)
+    def test_primary_client_cached(self, client_mock: MagicMock) -> None:
+        manager = self._create_manager()
+        client_mock.reset_mock()
+
+        class FakeClient:
+            pass
+
+        # return a distinct client per call so we can track their lifetimes
+        client_mock.side_effect = lambda *args, **kwargs: FakeClient()
+
+        client = manager._primary_client("manager address")
+        self.assertIs(manager._primary_client("manager address"), client)
+        self.assertEqual(client_mock.call_count, 1)
+
+        # the old client is released when the recovery source changes
+        client_ref = weakref.ref(client)
+        del client
+        other = manager._primary_client("other address")
+        self.assertEqual(client_mock.call_count, 2)
+        self.assertIsNone(client_ref())
+        self.assertIs(manager._primary_client_cache, other)
+
+    @patch("torchft.manager.ManagerClient", autospec=True)
+    def test_manager_logger(self, client_mock: MagicMock) -> None:
+        manager = self._create_manager()
+
+        with self.assertLogs("torchft.manager", level="INFO") as cm:
+            manager._logger.info("100% done")
+            manager._logger.warn("careful")
+        self.assertTrue(cm.output[0].endswith(" - step 0] 100% done"), cm.output)
+        self.assertIn("WARNING", cm.output[1])
+
+        # disabled messages are not formatted
+        with patch.object(
+            manager._logger._logger, "isEnabledFor", return_value=False
+        ), patch.object(manager, "current_step") as current_step:
+            manager._logger.info("skipped")
+        current_step.assert_not_called()
+
     @patch("torchft.manager.ManagerClient", autospec=True)
     def test_quorum_heal_async_not_enough_participants(
         self, client_mock: MagicMock
@@ -433,6 +492,38 @@ class TestManager(TestCase):
         manager.allreduce(torch.tensor([1.0])).wait()
         self.assertTrue(manager.should_commit())
 
+    @patch("torchft.manager.ManagerClient", autospec=True)
+    def test_allreduce_premul_sum(self, client_mock: MagicMock) -> None:
+        if not dist.is_nccl_available():
+            self.skipTest("PREMUL_SUM requires NCCL")
+
+        manager = self._create_manager()
+        manager._use_premul_sum = True
+
+        quorum = QuorumResult()
+        quorum.quorum_id = 123
+        quorum.replica_rank = 1
+        quorum.replica_world_size = 2
+        quorum.recover_src_manager_address = "manager address"
+        quorum.store_address = f"localhost:{self.store.port}"
+        quorum.max_step = 1
+        quorum.max_replica_rank = 1
+        quorum.max_world_size = 2
+        quorum.heal = False
+
+        client_mock()._quorum.return_value = quorum
+
+        manager.start_quorum()
+        manager.allreduce(torch.tensor([1.0]))
+        # pyre-ignore[16]: _pg is mocked
+        _, op = manager._pg.allreduce.call_args[0]
+        self.assertEqual(op, dist.ReduceOp.PREMUL_SUM)
+
+        # integer tensors can't be scaled by NCCL
+        manager.allreduce(torch.tensor([1]))
+        _, op = manager._pg.allreduce.call_args[0]
+        self.assertEqual(op, dist.ReduceOp.SUM)
+
     @patch("torchft.manager.ManagerClient", autospec=True)
     def test_pg_errored(self, client_mock: MagicMock) -> None:
         manager = self._create_manager()
@@ -792,6 +883,20 @@ class TestManager(TestCase):
         self.assertTrue(manager.should_commit())
         self.assertEqual(manager._commit_failures, 0)
 
+    def test_exception_with_traceback(self) -> None:
+        try:
+            raise RuntimeError("injected failure")
+        except RuntimeError as e:
+            error = ExceptionWithTraceback(e)
+
+        self.assertIs(error.original_exception, e)
+        self.assertIn("injected failure", str(error))
+        self.assertIn("test_exception_with_traceback", error.stack_trace)
+
+        # the formatted traceback is preserved across processes
+        unpickled = pickle.loads(pickle.dumps(error))
+        self.assertEqual(str(unpickled), str(error))
+
     @patch("torchft.manager.ManagerClient", autospec=True)
     def test_manager_error_handler(self, client_mock: MagicMock) -> None:
         """Test that the Manager correctly processes exceptions sent from the failure_listener_process."""
@@ -844,27 +949,66 @@ class TestManager(TestCase):
 
         # Make sure the error pipe is created
         self.assertIsNotNone(manager._error_pipe, "Manager should have an error pipe")
-        time.sleep(1)
-        # Create a mock error message
-        mock_error_msg = "Test failure detected from direct pipe test"
-        test_exception = Exception(mock_error_msg)
+        handled = _watch_error_handler(manager)
 
-        # Create an ExceptionWithTraceback and send it through the pipe
-        exc_with_tb = ExceptionWithTraceback(test_exception)
-        manager._error_remote.send(exc_with_tb)
+        # Send a mock error message through the pipe
+        mock_error_msg = "Test failure detected from direct pipe test"
+        manager._error_remote.send_bytes(mock_error_msg.encode("utf-8"))
 
-        # Wait a short time for the error processor thread to process the message
-        time.sleep(1)
+        # Wait for the error processor thread to process the message
+        self.assertTrue(handled.wait(timeout=5), "error was not processed in time")
 
         # Verify that the error was properly processed by the Manager
         error_obj = manager.errored()
         self.assertIsNotNone(
             error_obj, "Error should have been captured by the Manager"
         )
+        self.assertEqual(str(error_obj.original_exception), mock_error_msg)
 
         # Clean up
         manager.shutdown(wait=True)
 
+        # shutdown must wake up the blocking error processor thread
+        self.assertFalse(manager._error_processor_thread.is_alive())
+        self.assertTrue(manager._error_remote.closed())
+
+    def test_shutdown_no_wait_closes_error_pipe(self) -> None:
+        lighthouse = LighthouseServer(
+            bind="[::]:0",
+            min_replicas=1,
+            join_timeout_ms=100,
+        )
+        store = dist.TCPStore(
+            host_name="localhost",
+            port=0,
+            is_master=True,
+            wait_for_workers=False,
+        )
+        manager = Manager(
+            pg=ProcessGroupGloo(),
+            min_replica_size=1,
+            load_state_dict=lambda x: None,
+            state_dict=lambda: None,
+            replica_id=f"lighthouse_test",
+            store_addr="localhost",
+            store_port=store.port,
+            rank=0,
+            world_size=1,
+            use_async_quorum=False,
+            lighthouse_addr=lighthouse.address(),
+            proactive_recovery=True,
+        )
+
+        manager.shutdown(wait=False)
+
+        # our end of the pipe is released without waiting for the thread and
+        # the buffered wake up message still stops it
+        self.assertTrue(manager._error_remote.closed())
+        manager._error_processor_thread.join(timeout=5)
+        self.assertFalse(manager._error_processor_thread.is_alive())
+
+        lighthouse.shutdown()
+
     def test_manager_failure_e2e(self) -> None:
         """Test that the Manager correctly handles errors from the failure_listener_process."""
         # Create a manager with proactive_recovery=True to ensure it has an error pipe
@@ -897,12 +1041,15 @@ class TestManager(TestCase):
             proactive_recovery=True,
         )
 
+        handled = _watch_error_handler(manager)
+
+        # Give the listener process time to subscribe to the failure stream
         time.sleep(1.5)
 
         failed_replica_id = "failed_replica"
         lighthouse.inject_failure(failed_replica_id)
 
-        time.sleep(1.5)  # Prevent flakyness
+        self.assertTrue(handled.wait(timeout=5), "failure was not processed in time")
         error_obj = manager.errored()
 
         # Verify that the manager received the error notification
@@ -915,3 +1062,7 @@ class TestManager(TestCase):
 
         # Clean up resources
         manager.shutdown(wait=True)
+
+        # shutdown must wake up the blocking error processor thread
+        self.assertFalse(manager._error_processor_thread.is_alive())
+        self.assertTrue(manager._error_remote.closed())
@@ -2,7 +2,7 @@ import queue
 import time
 from datetime import timedelta
 from multiprocessing.connection import Connection
-from typing import Union
+from typing import Optional, Union
 
 import torch.multiprocessing as mp
 
@@ -14,7 +14,13 @@ class _MonitoredPipe:
     def send(self, obj: object) -> None:
         self._pipe.send(obj)
 
-    def recv(self, timeout: Union[float, timedelta]) -> object:
+    def recv(self, timeout: Optional[Union[float, timedelta]]) -> object:
+        """
+        Receives an object from the pipe, raising it if it's an Exception.
+
+        Args:
+            timeout: how long to wait for an object, None blocks indefinitely
+        """
         if isinstance(timeout, timedelta):
             timeout = timeout.total_seconds()
         if self._pipe.poll(timeout):
@@ -25,6 +31,23 @@ class _MonitoredPipe:
         else:
             raise TimeoutError(f"pipe.recv() timed out after {timeout} seconds")
 
+    def send_bytes(self, buf: bytes) -> None:
+        self._pipe.send_bytes(buf)
+
+    def recv_bytes(self, timeout: Optional[Union[float, timedelta]]) -> bytes:
+        """
+        Receives a raw message sent with ``send_bytes`` without unpickling it.
+
+        Args:
+            timeout: how long to wait for a message, None blocks indefinitely
+        """
+        if isinstance(timeout, timedelta):
+            timeout = timeout.total_seconds()
+        if self._pipe.poll(timeout):
+            return self._pipe.recv_bytes()
+        else:
+            raise TimeoutError(f"pipe.recv_bytes() timed out after {timeout} seconds")
+
     def close(self) -> None:
         self._pipe.close()
 
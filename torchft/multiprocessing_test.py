@@ -15,6 +15,11 @@ def pipe_put(q: "Connection[object, object]") -> None:
     q.send(1)
 
 
+def pipe_put_bytes(q: "Connection[object, object]") -> None:
+    q.recv_bytes()
+    q.send_bytes(b"hello")
+
+
 class MultiprocessingTest(TestCase):
     def test_monitored_queue_put(self) -> None:
         ctx = mp.get_context("fork")
@@ -56,3 +61,38 @@ class MultiprocessingTest(TestCase):
 
         mq.close()
         assert mq.closed()
+
+    def test_monitored_queue_get_no_timeout(self) -> None:
+        ctx = mp.get_context("fork")
+        local, remote = ctx.Pipe()
+        p = ctx.Process(target=pipe_put, args=(remote,), daemon=True)
+        p.start()
+        del remote
+
+        mq = _MonitoredPipe(local)
+        mq.send(1)
+
+        self.assertEqual(mq.recv(timeout=None), 1)
+
+        mq.close()
+        assert mq.closed()
+
+    def test_monitored_queue_bytes(self) -> None:
+        ctx = mp.get_context("fork")
+        local, remote = ctx.Pipe()
+        p = ctx.Process(target=pipe_put_bytes, args=(remote,), daemon=True)
+        p.start()
+        del remote
+
+        mq = _MonitoredPipe(local)
+
+        with self.assertRaisesRegex(TimeoutError, "timed out after 0.0 seconds"):
+            mq.recv_bytes(timeout=0.0)
+
+        mq.send_bytes(b"")
+        self.assertEqual(mq.recv_bytes(timeout=10), b"hello")
+        with self.assertRaises(EOFError):
+            mq.recv_bytes(timeout=10)
+
+        mq.close()
+        assert mq.closed()
@@ -12,6 +12,9 @@ from datetime import timedelta
 REPLICA_GROUP_ID = int(os.environ.get("REPLICA_GROUP_ID", 0))
 os.environ["CUDA_VISIBLE_DEVICES"] = str(REPLICA_GROUP_ID % 4)
 os.environ["NCCL_HOSTID"] = str(REPLICA_GROUP_ID)
+# Growable segments avoid fragmenting the caching allocator as the large
+# embedding, its gradients and optimizer state are reallocated across recoveries.
+os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True")
 
 import torch
 import torch.nn.functional as F
@@ -34,13 +37,58 @@ from torchft.checkpointing.pg_transport import PGTransport
 logging.basicConfig(level=logging.INFO)
 
 
+class Net(nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.cnn = nn.Sequential(
+            nn.Conv2d(3, 6, 5),
+            nn.ReLU(),
+            nn.MaxPool2d(2, 2),
+            nn.Conv2d(6, 16, 5),
+            nn.ReLU(),
+            nn.MaxPool2d(2, 2),
+        )
+
+        final_dim = 10
+        # We add a useless 1GB intermediate layer so we spend more time in dist
+        # communication so injected failures are more likely to cause issues
+        # if they exist. Set USELESS_LAYER_BYTES=0 to benchmark the model
+        # without the extra communication.
+        target_size = int(os.environ.get("USELESS_LAYER_BYTES", 1_000_000_000))
+        self.useless = (
+            nn.Embedding(target_size // final_dim // 4, final_dim)
+            if target_size > 0
+            else None
+        )
+
+        self.classifier = nn.Sequential(
+            nn.Linear(16 * 5 * 5, 120),
+            nn.ReLU(),
+            nn.Linear(120, 84),
+            nn.ReLU(),
+            nn.Linear(84, final_dim),
+        )
+
+    def forward(self, x):
+        x = self.cnn(x)
+        x = torch.flatten(x, 1)  # flatten all dimensions except batch
+        x = self.classifier(x)
+        if self.useless is not None:
+            x += self.useless.weight[0]
+        return x
+
+
 @record
 def main() -> None:
     REPLICA_GROUP_ID = int(os.environ.get("REPLICA_GROUP_ID", 0))
     NUM_REPLICA_GROUPS = int(os.environ.get("NUM_REPLICA_GROUPS", 2))
 
+    # ToTensor returns a fresh tensor so it's safe to normalize it in place
     transform = transforms.Compose(
-        [transforms.ToTensor(), transforms.Normalize((0.5, 0.5, 0.5), (0.5, 0.5, 0.5))]
+        [
+            transforms.ToTensor(),
+            transforms.Normalize((0.5, 0.5, 0.5), (0.5, 0.5, 0.5), inplace=True),
+        ]
     )
     trainset = torchvision.datasets.CIFAR10(
         root="./cifar", train=True, download=True, transform=transform
@@ -61,8 +109,19 @@ def main() -> None:
 
     # This uses the torchdata StatefulDataLoader to be able to checkpoint and
     # restore the per worker dataloader position.
+    # Pinned host memory lets the host to device copies below run
+    # asynchronously and persistent workers avoid respawning the worker
+    # processes every epoch. The trailing partial batch is dropped so every
+    # batch has the same shape.
+    batch_size = 64
     trainloader = StatefulDataLoader(
-        trainset, batch_size=64, num_workers=2, sampler=sampler
+        trainset,
+        batch_size=batch_size,
+        num_workers=2,
+        sampler=sampler,
+        pin_memory=torch.cuda.is_available(),
+        persistent_workers=True,
+        drop_last=True,
     )
 
     def load_state_dict(state_dict):
@@ -76,6 +135,13 @@ def main() -> None:
         }
 
     device = "cuda" if torch.cuda.is_available() else "cpu"
+    # the input shape is fixed so let cuDNN pick the fastest algorithms once
+    torch.backends.cudnn.benchmark = True
+    # use tensor cores for the fp32 matmuls/convs and run the forward pass in
+    # bf16 where supported, bf16 doesn't need loss scaling
+    torch.backends.cuda.matmul.allow_tf32 = True
+    torch.backends.cudnn.allow_tf32 = True
+    use_bf16 = torch.cuda.is_available() and torch.cuda.is_bf16_supported()
     pg = (
         ProcessGroupNCCL(
             timeout=timedelta(seconds=30),
@@ -87,7 +153,10 @@ def main() -> None:
     transport = PGTransport(
         pg,
         timeout=timedelta(seconds=10),
-        device=("cuda" if torch.cuda.is_available() else "cpu"),
+        device=torch.device(device),
+        # Receive recovered weights directly into the existing model/optimizer
+        # tensors instead of staging a second copy on the CPU.
+        state_dict=lambda: {"user": state_dict(), "torchft": {}},
     )
 
     manager = Manager(
@@ -100,41 +169,11 @@ def main() -> None:
         checkpoint_transport=transport,
     )
 
-    class Net(nn.Module):
-        def __init__(self):
-            super().__init__()
-            self.cnn = nn.Sequential(
-                nn.Conv2d(3, 6, 5),
-                nn.ReLU(),
-                nn.MaxPool2d(2, 2),
-                nn.Conv2d(6, 16, 5),
-                nn.ReLU(),
-                nn.MaxPool2d(2, 2),
-            )
-
-            final_dim = 10
-            # We add a useless 1GB intermediate layer so we spend more time in dist
-            # communication so injected failures are more likely to cause issues
-            # if they exist.
-            target_size = 1_000_000_000
-            self.useless = nn.Embedding(target_size // final_dim // 4, final_dim)
-
-            self.classifier = nn.Sequential(
-                nn.Linear(16 * 5 * 5, 120),
-                nn.ReLU(),
-                nn.Linear(120, 84),
-                nn.ReLU(),
-                nn.Linear(84, final_dim),
-            )
-
-        def forward(self, x):
-            x = self.cnn(x)
-            x = torch.flatten(x, 1)  # flatten all dimensions except batch
-            x = self.classifier(x)
-            x += self.useless.weight[0]
-            return x
-
     m = Net().to(device)
+    if os.environ.get("TORCH_COMPILE", "0") == "1":
+        # The batch shape is fixed so on GPU we can use CUDA graphs to cut the
+        # per kernel launch overhead of this small model.
+        m = torch.compile(m, mode="reduce-overhead" if device == "cuda" else None)
     m = DistributedDataParallel(manager, m)
     optimizer = Optimizer(manager, optim.AdamW(m.parameters()))
     criterion = nn.CrossEntropyLoss()
@@ -155,27 +194,40 @@ def main() -> None:
 
     # You can use an epoch based training but with faults it's easier to use step
     # based training.
+    # Profiling adds overhead to every op so it's opt-in, set TORCHFT_PROFILE=1
+    # to capture traces and TORCHFT_PROFILE_MEMORY=1 to also record allocations.
+    profile = os.environ.get("TORCHFT_PROFILE", "0") == "1"
     prof = torch.profiler.profile(
         schedule=torch.profiler.schedule(wait=5, warmup=1, active=10, repeat=2),
         on_trace_ready=trace_handler,
         record_shapes=True,
-        profile_memory=True,
+        profile_memory=os.environ.get("TORCHFT_PROFILE_MEMORY", "0") == "1",
     )
 
-    prof.start()
+    # The batch shape is fixed so copy each batch into the same device buffers
+    # rather than allocating new ones every step.
+    input_buf = torch.empty((batch_size, 3, 32, 32), device=device)
+    label_buf = torch.empty((batch_size,), dtype=torch.long, device=device)
+
+    if profile:
+        prof.start()
     while True:
         for i, (inputs, labels) in enumerate(trainloader):
-            prof.step()
+            if profile:
+                prof.step()
 
-            inputs = inputs.to(device)
-            labels = labels.to(device)
+            inputs = input_buf.copy_(inputs, non_blocking=True)
+            labels = label_buf.copy_(labels, non_blocking=True)
 
             # must be called at the beginning of each train loop
             # Quorum computation is triggered here but only needed in the backwards pass.
-            optimizer.zero_grad()
+            optimizer.zero_grad(set_to_none=True)
 
-            out = m(inputs)
-            loss = criterion(out, labels)
+            with torch.autocast(
+                device_type=device, dtype=torch.bfloat16, enabled=use_bf16
+            ):
+                out = m(inputs)
+                loss = criterion(out, labels)
 
             # Gradient allreduce overlaps with the backwards pass.
             loss.backward()
@@ -184,8 +236,10 @@ def main() -> None:
             # This may not actually step the optimizer if an error occured during grad allreduce.
             optimizer.step()
 
-            if manager.current_step() % 100 == 0:
-                print(f"[{manager.current_step()}] loss = {loss.item()}")
+            # the step only changes in optimizer.step() so read it once
+            step = manager.current_step()
+            if step % 100 == 0:
+                print(f"[{step}] loss = {loss.item()}")
 
             # TODO (by the user): periodically checkpoint model, optim, manager and dataloader
 
@@ -196,9 +250,10 @@ def main() -> None:
             # they're shared across all groups and will load from existing replicas as
             # long as not every worker goes down.
 
-            if manager.current_step() >= 10000:
+            if step >= 10000:
                 # complete training
-                prof.stop()
+                if profile:
+                    prof.stop()
                 exit()
 
 